@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Callable, Any
-from io import StringIO
+from typing import Callable, Coroutine, Iterable, Any
 from pathlib import Path
-import argparse, asyncio, os, re, sys
+from contextlib import nullcontext
+import argparse, asyncio, os, signal, sys, threading
+
+if sys.platform == "linux":
+    import fcntl
 
 # You can add game constants here, like a board size for example
 
+# Size of the buffers between the game and the AIs (1MiB is the default maximum pipe size on Linux)
+PIPE_BUFFER_SIZE = 1 << 20
+
+# Maximum number of lines read from an AI and waiting for the game,
+# past that the AI waits for the game to read its output
+MAX_QUEUED_LINES = 256
+
 # Default Timeouts :
 TIMEOUT_LENGTH = 0.1
 DISCORD_TIMEOUT = 60
+STOP_TIMEOUT = 2
+TRACEBACK_TIMEOUT = 0.5
+
+# Number of invalid moves a human can make in a row before being eliminated
+MAX_HUMAN_TRIES = 3
+
+# Maximum number of characters of an AI traceback that will be displayed
+TRACEBACK_MAX_SIZE = 65536
+
+# Maximum number of discord messages waiting to be sent before the game waits for them
+DISCORD_MAX_PENDING = 8
+
+# Maximum number of AIs starting at the same time
+MAX_CONCURRENT_PLAYERS = min(32, (os.cpu_count() or 4) * 2)
 
 # Usefull emojis :
 EMOJI_NUMBERS = ('0️⃣', '1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣')
@@ -25,10 +49,20 @@ ValidInput = str
 InputFunction = Callable[..., str]      # function asking a discord player to make a move, returns the discord answer
 OutputFunction = Callable[[str], None]  # function called when an AI wants to "talk" to discord, the argument being the message
 
+# How to start an AI depending on its file extension, anything else is run as an executable
+_COMMAND_BUILDERS: dict[str, Callable[[Path], list[str]]] = {
+    ".py": lambda path: ["python3", str(path)],
+    ".js": lambda path: ["node", str(path)],
+    ".class": lambda path: ["java", "-cp", str(path.parent), path.stem],
+}
+
 
 class Player(ABC):
 
     ofunc = None
+    _pending: set[asyncio.Task] = set()
+    _last_sent: asyncio.Task | None = None
+    _send_error: Exception | None = None
 
     def __init__(self, no: int, name: str = None, **kwargs):
         """The abstract Player constructor
@@ -63,9 +97,36 @@ class Player(ABC):
         pass
 
     async def tell_other_players(self, players: list[Player], move: ValidInput):
+        await Player.broadcast(players, [(self, move)])
+
+    @staticmethod
+    async def broadcast(players: list[Player], moves: list[tuple[Player, ValidInput]]):
+        """Tells every alive player the moves made by the other players, in the given order
+
+        Args:
+            players (`list[Player]`): The list of players
+            moves (`list[tuple[Player, ValidInput]]`): The players who played and their moves
+        """
+        # The messages for the AIs are encoded only once for all of them
+        payloads = [(player, f"{move}\n".encode()) for player, move in moves]
+        tellers = []
+        recipients = []
         for other_player in players:
-            if self != other_player and other_player.alive:
-                await other_player.tell_move(move)
+            if not other_player.alive:
+                continue
+            if isinstance(other_player, AI):
+                # All the moves for an AI are written at once
+                batch = [payload for player, payload in payloads if player != other_player]
+                if batch:
+                    tellers.append(other_player.tell_move_bytes(*batch))
+                    recipients.append(other_player)
+            else:
+                tellers.extend(other_player.tell_move(move) for player, move in moves if player != other_player)
+
+        # Every move is written first and flushed together afterwards,
+        # so the players don't wait for each other's pipe
+        await asyncio.gather(*tellers)
+        await asyncio.gather(*(ai.drain() for ai in recipients))
 
     @staticmethod
     async def sanithize(userInput: str, **kwargs) -> tuple[ValidMove, None] | tuple[None | str]:
@@ -95,15 +156,58 @@ class Player(ABC):
         return processed_input, None
 
     @staticmethod
-    async def print(output: StringIO | str, send_discord=True, end="\n"):
-        if isinstance(output, StringIO):
-            text = output.getvalue()
-            output.close()
-        else:
-            text = output + end
+    async def print(output: str, send_discord=True, end="\n"):
+        text = output + end
         print(text, end="")
         if Player.ofunc and send_discord:
-            await Player.ofunc(text)
+            # A message that failed to be sent stops the game here
+            Player._raise_send_error()
+            # Discord messages are sent in the background so the game doesn't wait for them,
+            # each one waits for the previous one to keep them in order
+            if len(Player._pending) >= DISCORD_MAX_PENDING:
+                await asyncio.wait(Player._pending, return_when=asyncio.FIRST_COMPLETED)
+            task = asyncio.create_task(Player._send(Player.ofunc, text, Player._last_sent))
+            Player._pending.add(task)
+            task.add_done_callback(Player._sent)
+            Player._last_sent = task
+
+    @staticmethod
+    async def _send(ofunc: OutputFunction, text: str, previous: asyncio.Task | None):
+        if previous:
+            await asyncio.wait((previous,))
+        await ofunc(text)
+
+    @staticmethod
+    def _sent(task: asyncio.Task):
+        Player._pending.discard(task)
+        # The first failure is kept for the next `print` or `flush` to raise it
+        if not task.cancelled() and task.exception() and not Player._send_error:
+            Player._send_error = task.exception()
+
+    @staticmethod
+    def _raise_send_error():
+        error, Player._send_error = Player._send_error, None
+        if error:
+            raise error
+
+    @staticmethod
+    async def flush(raise_error: bool = True):
+        """Waits for all the discord messages to be sent
+
+        Args:
+            raise_error (`bool`, optional): Whether to raise the error of a message that failed to be sent,
+                otherwise it is dropped. Defaults to True.
+
+        Raises:
+            Exception: The first error raised while sending a message
+        """
+        if Player._pending:
+            await asyncio.wait(Player._pending)
+        Player._last_sent = None
+        if raise_error:
+            Player._raise_send_error()
+        else:
+            Player._send_error = None
 
     def __str__(self):
         return self.rendered_name
@@ -122,10 +226,15 @@ class Human(Player):
         """
         super().__init__(no, name, **kwargs)
         self.ifunc = ifunc
+        # Set by `game()` for terminal players, who are asked one at a time
+        self.terminal_lock = nullcontext()
 
         # Here you can personnalize human players name specifically
         self.rendered_name = f"{self.name} {self.icon}" if name else f"Player {self.icon}"
 
+        # You can customize your message asking for a move here :
+        self.move_prompt = f"Awaiting {self}'s move : "
+
     async def start_game(self):
         await super().start_game()
 
@@ -133,28 +242,35 @@ class Human(Player):
         await super().lose_game()
     
     # Don't forget to replace <**kwargs> with the arguments necessary for parsing the input
-    async def ask_move(self, **kwargs):
+    async def ask_move(self, debug: bool = True, **kwargs):
         await super().ask_move(**kwargs)
-        # You can customize your message asking for a move here :
-        await Player.print(f"Awaiting {self}'s move : ", end="")
-        try:
-            user_input = await self.input()
-        except asyncio.TimeoutError:
-            await Player.print(f"User did not respond in time (over {DISCORD_TIMEOUT}s)")
-            return None, "timeout"
+        async with self.terminal_lock:
+            await Player.print(self.move_prompt, end="")
+            try:
+                user_input = await self.input()
+            except asyncio.TimeoutError:
+                await Player.print(f"User did not respond in time (over {DISCORD_TIMEOUT}s)")
+                return None, "timeout"
+            except EOFError:
+                # The terminal input was closed, there is no point asking again
+                await Player.print("")
+                return None, "input closed"
         # This is where the kwargs are usefull :
         return await Human.sanithize(user_input, **kwargs)
 
     async def tell_move(self, move: ValidInput):
-        return super().tell_move(move)
+        await super().tell_move(move)
 
     async def input(self):
         if self.ifunc:
+            # The player must see the board and the prompt before being asked
+            await Player.flush()
             user_input = await asyncio.wait_for(self.ifunc(self.name), timeout=DISCORD_TIMEOUT)
             await Player.print(user_input, send_discord=False)
             return user_input
         else:
-            return input()
+            # Reading the terminal in another thread lets the AIs keep running meanwhile
+            return await read_terminal_line()
 
 class AI(Player):
 
@@ -169,21 +285,14 @@ class AI(Player):
             Exception: File not found error
 
         Returns:
-            `str`: the command to start the AI
+            `list[str]`: the arguments of the command to start the AI
         """
         path = Path(progPath)
         if not path.is_file():
             raise FileNotFoundError(f"File {progPath} not found\n")
 
-        match path.suffix:
-            case ".py":
-                return f"python3 {progPath}"
-            case ".js":
-                return f"node {progPath}"
-            case ".class":
-                return f"java -cp {os.path.dirname(progPath)} {os.path.splitext(os.path.basename(progPath))[0]}"
-            case _:
-                return f"./{progPath}"
+        builder = _COMMAND_BUILDERS.get(path.suffix)
+        return builder(path) if builder else [str(path.resolve())]
 
     def __init__(self, no: int, prog_path: str, discord: bool, **kwargs):
         """The AI player constructor
@@ -196,6 +305,9 @@ class AI(Player):
         super().__init__(no, Path(prog_path).stem, **kwargs)
         self.prog_path = prog_path
         self.command = AI.prepare_command(self.prog_path)
+        self.prog = None
+        self._reader_task = None
+        self._reader_error = None
 
         # Once again, you can personnalize how the AI player will be called during the game here
         if discord:
@@ -203,23 +315,51 @@ class AI(Player):
             self.rendered_name = f"<@{self.name}>'s AI {self.icon}"
         else:
             self.rendered_name = f"AI {self.icon} ({self.name})"
+
+        # You can customize the message all bots will send to announce their moves here :
+        self.move_announce = f"{self}'s move : "
     
     async def drain(self):
-        if self.prog.stdin.transport._conn_lost:
+        if not self.prog.stdin:
+            return
+        try:
+            await self.prog.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # The AI doesn't read its input anymore, it will fail its next move
             self.prog.stdin.close()
-            self.prog.stdin = asyncio.subprocess.PIPE
-        await self.prog.stdin.drain()
+            self.prog.stdin = None
+
+    def _enlarge_stdin_pipe(self):
+        # On Linux, a bigger pipe lets big messages (like a whole board) be written without waiting for the AI to read
+        if sys.platform != "linux" or not self.prog.stdin:
+            return
+        pipe = self.prog.stdin.transport.get_extra_info("pipe")
+        if pipe is None:
+            return
+        try:
+            fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+        except OSError:
+            # Not allowed above /proc/sys/fs/pipe-max-size, the default size still works
+            pass
 
     async def start_game(self, **kwargs):
         # You can specify here what parameters are required to start a game for an AI player.
         # For example : board size, number of players...
         await super().start_game()
-        self.prog = await asyncio.create_subprocess_shell(
-            AI.prepare_command(self.prog_path),
+        self.prog = await asyncio.create_subprocess_exec(
+            *self.command,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
+            limit=PIPE_BUFFER_SIZE,
+            # The AI gets its own process group so that anything it starts is stopped with it
+            start_new_session=True
         )
+        self._enlarge_stdin_pipe()
+        # The AI's output is read line by line in the background for the whole game,
+        # ask_move only has to pick the lines up from the queue
+        self._lines = asyncio.Queue(maxsize=MAX_QUEUED_LINES)
+        self._reader_task = asyncio.create_task(self._pump_stdout()) if self.prog.stdout else None
 
         if self.prog.stdin:
             # Here, write the NORMALIZED message you'll send to the AIs for them to start the game.
@@ -227,65 +367,117 @@ class AI(Player):
             self.prog.stdin.write(f"Your message here\n".encode())
             await self.drain()
 
+    async def _pump_stdout(self):
+        try:
+            while line := await self.prog.stdout.readline():
+                await self._lines.put(line.decode(errors="replace").rstrip())
+        except (ValueError, asyncio.LimitOverrunError) as e:
+            # readline fails on lines longer than PIPE_BUFFER_SIZE, ask_move reports it
+            self._reader_error = e
+        finally:
+            # None tells ask_move that the AI's output ended,
+            # unless the game stopped the reader and nobody reads the lines anymore
+            if not asyncio.current_task().cancelling():
+                await self._lines.put(None)
+
+    async def _read_traceback(self) -> list[str]:
+        # The end of the traceback is only awaited for a short time and up to a limited size,
+        # so that an AI flooding its output can't block the game
+        lines = []
+        size = 0
+        try:
+            async with asyncio.timeout(TRACEBACK_TIMEOUT):
+                while size < TRACEBACK_MAX_SIZE and (line := await self._lines.get()) is not None:
+                    line = line[:TRACEBACK_MAX_SIZE - size]
+                    lines.append(line)
+                    size += len(line)
+        except asyncio.TimeoutError:
+            pass
+        return lines
+
     async def lose_game(self):
         await super().lose_game()
 
     # Don't forget to replace <**kwargs> with the arguments necessary for parsing the input
     async def ask_move(self, debug: bool = True, **kwargs) -> tuple[tuple[int, int] | None, str | None]:
         await super().ask_move(**kwargs)
+        if not self._reader_task or not self.prog.stdin:
+            return None, "communication failed"
+
+        # The AI has TIMEOUT_LENGTH for its whole turn, debug lines included
+        debug_lines = []
         try:
-            while True:
-                if not self.prog.stdout:
-                    return None, "communication failed"
-                progInput = await asyncio.wait_for(self.prog.stdout.readuntil(), TIMEOUT_LENGTH)
-
-                if not isinstance(progInput, bytes):
-                    continue
-                progInput = progInput.decode().strip()
-
-                if progInput.startswith("Traceback"):
-                    output = StringIO()
-                    if debug:
-                        print(file=output)
-                        print(progInput, file=output)
-                        progInput = self.prog.stdout.read()
-                        if isinstance(progInput, bytes):
-                            print(progInput.decode(), file=output)
-                        await Player.print(output)
-                    return None, "error"
-                
-                if progInput.startswith(">"):
+            async with asyncio.timeout(TIMEOUT_LENGTH):
+                while True:
+                    progInput = await self._lines.get()
+                    if progInput is None:
+                        raise EOFError
+                    progInput = progInput.strip()
+
                     # Any bot can write lines starting with ">" to debug in local.
                     # It is recommended to remove any debug before playing
                     # against other players to avoid reverse engineering!
-                    if debug:
-                        await Player.print(f"{self} {progInput}")
-                else:
-                    break
+                    if not progInput.startswith(">"):
+                        break
+                    debug_lines.append(progInput)
+        except (asyncio.TimeoutError, EOFError):
+            progInput = None
+
+        if debug:
+            for line in debug_lines:
+                await Player.print(f"{self} {line}")
 
-            # You can customize the message all bots will send to announce their moves here :
-            await Player.print(f"{self}'s move : {progInput}")
+        if progInput is None and self._reader_error:
+            await Player.print(f"{self}'s output could not be read : {self._reader_error}")
+            return None, "communication failed"
 
-        except (asyncio.TimeoutError, asyncio.exceptions.IncompleteReadError):
+        if progInput is None:
             await Player.print(f"AI did not respond in time (over {TIMEOUT_LENGTH}s)")
             return None, "timeout"
-        
+
+        if progInput.startswith("Traceback"):
+            if debug:
+                await Player.print("\n".join(["", progInput, *await self._read_traceback()]))
+            return None, "error"
+
+        await Player.print(self.move_announce + progInput)
+
         # This is where the kwargs are usefull :
         return await AI.sanithize(progInput, **kwargs)
 
     async def tell_move(self, move: ValidInput):
+        # The AIs should keep track of who's playing themselves.
+        await self.tell_move_bytes(f"{move}\n".encode())
+
+    async def tell_move_bytes(self, *payloads: bytes):
         if self.prog.stdin:
-            # The AIs should keep track of who's playing themselves.
-            self.prog.stdin.write(f"{move}n".encode())
-            await self.drain()
+            # It is only flushed by `drain`, which `Player.broadcast` takes care of.
+            self.prog.stdin.writelines(payloads)
 
     async def stop_game(self):
+        if not self.prog:
+            return
+        if self._reader_task:
+            self._reader_task.cancel()
         try:
-            self.prog.terminate()
-            await self.prog.wait()
+            self._signal()
+            try:
+                await asyncio.wait_for(self.prog.wait(), STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                self._signal(force=True)
+                await self.prog.wait()
         except ProcessLookupError:
             pass
 
+    def _signal(self, force: bool = False):
+        if sys.platform == "win32":
+            if force:
+                self.prog.kill()
+            else:
+                self.prog.terminate()
+        else:
+            os.killpg(self.prog.pid, signal.SIGKILL if force else signal.SIGTERM)
+
 
 # Here is a place to define functions useful for your game, typically:
 #  - checking for a win or a draw,
@@ -294,7 +486,53 @@ class AI(Player):
 #  - ...
 
 
-async def game(players: list[Human | AI], debug: bool, **kwargs) -> tuple[list[Human | AI], Human | AI | None, dict]:
+async def gather_bounded(coros: Iterable[Coroutine], limit: int = MAX_CONCURRENT_PLAYERS) -> list:
+    """Runs coroutines concurrently, at most `limit` at a time.
+    An exception raised by one of them doesn't cancel the other ones.
+
+    Args:
+        coros (`Iterable[Coroutine]`): The coroutines to run
+        limit (`int`, optional): The maximum number of coroutines running at the same time. Defaults to MAX_CONCURRENT_PLAYERS.
+
+    Returns:
+        `list`: The result or the raised exception of each coroutine, in the same order
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Coroutine):
+        async with semaphore:
+            try:
+                return await coro
+            except Exception as e:
+                return e
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(run(coro)) for coro in coros]
+    return [task.result() for task in tasks]
+
+
+async def ask_valid_move(player: Human | AI, debug: bool, **kwargs) -> tuple[ValidMove, None] | tuple[None | str]:
+    """Asks a player for a move until it gives a valid one.
+    AIs only get one try, humans get up to MAX_HUMAN_TRIES unless they stop, time out or close their input.
+
+    Args:
+        player (`Human | AI`): The player to ask
+        debug (`bool`): Whether to print the debug output of the AIs
+
+    Returns:
+        `tuple[ValidMove, None] | tuple[None | str]`
+    """
+    user_input, error = None, None
+    tries = 1 if isinstance(player, AI) else MAX_HUMAN_TRIES
+    for _ in range(tries):
+        # Don't forget to give the kwargs necessary for an AI (or a player) to understand what's asked
+        user_input, error = await player.ask_move(debug, **kwargs)
+        if user_input or error in ("user interrupt", "timeout", "input closed"):
+            break
+    return user_input, error
+
+
+async def game(players: list[Human | AI], debug: bool, simultaneous: bool = False, **kwargs) -> tuple[list[Human | AI], Human | AI | None, dict]:
     """The function handling all the game logic.
     Once again, you can add as many kwargs as you need.
     Note that you can return anything you need that will be treated in `main()` after the specified args.
@@ -302,6 +540,8 @@ async def game(players: list[Human | AI], debug: bool, **kwargs) -> tuple[list[H
     Args:
         players (`list[Human | AI]`): The list of players
         debug (`bool`): _description_
+        simultaneous (`bool`, optional): Whether all players play at the same time each round
+            instead of one after the other. Defaults to False.
 
     Returns:
         `tuple[list[Human | AI], Human | AI | None, dict, ...]`: A whole bunch of game data to help display and judge the result
@@ -310,66 +550,155 @@ async def game(players: list[Human | AI], debug: bool, **kwargs) -> tuple[list[H
     nb_players = len(players)
     alive_players = nb_players
     errors = {} # This is for logging and debugginf purposes
-    starters = (player.start_game(**kwargs) for player in players)
-    await asyncio.gather(*starters)
-    turn = 0
     winner = None
 
-    # Initialize general game objects here, like the board
+    # Terminal players share the same keyboard, they are asked for their moves one at a time
+    terminal_lock = asyncio.Lock()
+    for player in players:
+        if isinstance(player, Human) and not player.ifunc:
+            player.terminal_lock = terminal_lock
+
+    # The AIs are stopped even if the game is interrupted (Ctrl+C, cancellation or an error),
+    # they run in their own process group so nothing else would stop them
+    interrupted = True
+    try:
+        starters = (player.start_game(**kwargs) for player in players)
+        # A player failing to start is eliminated without stopping the other ones
+        results = await gather_bounded(starters)
+        for player, result in zip(players, results):
+            if isinstance(result, Exception):
+                await player.lose_game()
+                errors[player] = repr(result)
+                player.alive = False
+                alive_players -= 1
+        turn = 0
+
+        # Initialize general game objects here, like the board
 
-    # game loop
-    while alive_players >= 2:
-        i = turn % nb_players
-        player = players[i]
+        # game loop when all the players play at the same time
+        while alive_players >= 2 and simultaneous:
+            await Player.print() # Render the grid for all the players here
 
-        if not player.alive:
-            # It is essential to notify of a player "death" so that AIs can skip their turn.
-            # Replace `None` by a NORMALIZED simple value signifying an incorrect move. 
-            await player.tell_other_players(players, None)
+            # Every alive player is asked at the same time
+            asked = [player for player in players if player.alive]
+            answers = await asyncio.gather(*(ask_valid_move(player, debug, **kwargs) for player in asked))
+            moves = {}
 
-        else :
-            await Player.print() # Render the grid for the player here
+            # Then the moves are resolved in the players' order
+            for player, (user_input, error) in zip(asked, answers):
+                if not user_input:
+                    await player.lose_game()
+                    errors[player] = error
+                    player.alive = False
+                    alive_players -= 1
 
-            # player input
-            user_input, error = None, None
-            while not user_input:
-                # Don't forget to give the kwargs necessary for an AI (or a player) to understand what's asked
-                user_input, error = await player.ask_move(debug, **kwargs)
-                if isinstance(player, AI) or error in ("user interrupt", "timeout"):
-                    break
+                else:
+                    # Apply the user_input to the game here, it already went through sanithization so it is a ValidMove
+                    # You'll also need to convert to a ValidInput to notify all the AIs of the played move
+                    moves[player] = "valid input here"
 
-            # saving eventual error
-            if not user_input:
-                await player.lose_game()
-                errors[player] = error
-                player.alive = False
-                alive_players -= 1
+            # Each AI is told the moves of all the other players, in the players' order.
+            # Replace `None` by a NORMALIZED simple value signifying an incorrect move or a dead player.
+            await Player.broadcast(players, [(player, moves.get(player)) for player in players])
+
+            # Check for wins or draw here.
+            # Any end must break the `while alive_players >= 2`.
+
+        # game loop when the players play one after the other
+        while alive_players >= 2 and not simultaneous:
+            i = turn % nb_players
+            player = players[i]
+
+            if not player.alive:
                 # It is essential to notify of a player "death" so that AIs can skip their turn.
                 # Replace `None` by a NORMALIZED simple value signifying an incorrect move. 
                 await player.tell_other_players(players, None)
 
-            else:
-                # Apply the user_input to the game here, it already went through sanithization so it is a ValidMove
-                # You'll also need to convert to a ValidInput to notify all the AIs of the played move
-                await player.tell_other_players(players, "valid input here")
-            
-                # Check for wins or draw here.
-                # Any end must break the `while alive_players >= 2`.
-                # Do this step early to avoid an infinite loop!
-        
-        turn += 1
+            else :
+                await Player.print() # Render the grid for the player here
 
-    if alive_players == 1:
-        # nobreak
-        winner = [player for player in players if player.alive][0]
-    
-    enders = (player.stop_game() for player in players if isinstance(player, AI))
-    await asyncio.gather(*enders)
+                # player input
+                user_input, error = await ask_valid_move(player, debug, **kwargs)
+
+                # saving eventual error
+                if not user_input:
+                    await player.lose_game()
+                    errors[player] = error
+                    player.alive = False
+                    alive_players -= 1
+                    # It is essential to notify of a player "death" so that AIs can skip their turn.
+                    # Replace `None` by a NORMALIZED simple value signifying an incorrect move. 
+                    await player.tell_other_players(players, None)
+
+                else:
+                    # Apply the user_input to the game here, it already went through sanithization so it is a ValidMove
+                    # You'll also need to convert to a ValidInput to notify all the AIs of the played move
+                    await player.tell_other_players(players, "valid input here")
+
+                    # Check for wins or draw here.
+                    # Any end must break the `while alive_players >= 2`.
+                    # Do this step early to avoid an infinite loop!
+
+            turn += 1
+
+        if alive_players == 1:
+            # nobreak
+            winner = next(player for player in players if player.alive)
+        interrupted = False
+
+    finally:
+        # Stopping an AI only sends signals, so they are all stopped at once
+        enders = (player.stop_game() for player in players if isinstance(player, AI))
+        await asyncio.gather(*enders, return_exceptions=True)
+
+        # A discord error must not hide the one that interrupted the game
+        await Player.flush(raise_error=not interrupted)
 
     # You can add extra returned stuff here, like the final board and other stuff
     return players, winner, errors
 
 
+def read_terminal_line() -> asyncio.Future[str]:
+    """Reads a line of the terminal in a daemon thread.
+    Unlike an executor, nothing waits for the thread when the future is cancelled,
+    so Ctrl+C ends the game even while a player is typing.
+
+    Returns:
+        `asyncio.Future[str]`: The line read, or the error (like `EOFError`) raised by `input()`
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(line: str | None, error: Exception | None):
+        if future.done():
+            # The future was cancelled meanwhile
+            return
+        if error:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+
+    def read():
+        try:
+            line, error = input(), None
+        except Exception as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, line, error)
+        except RuntimeError:
+            # The loop is closed, nobody is waiting for the line anymore
+            pass
+
+    threading.Thread(target=read, daemon=True).start()
+    return future
+
+
+def _is_mention(name: str) -> bool:
+    # A discord mention looks like <@123456789012345678>
+    return len(name) == 21 and name.startswith("<@") and name.endswith(">") \
+        and name[2:-1].isascii() and name[2:-1].isdigit()
+
+
 async def main(raw_args: str = None, ifunc: InputFunction = None, ofunc: OutputFunction = None, discord=False):
     # these arguments should not be messed with because that's how the discord bot works
 
@@ -389,12 +718,11 @@ async def main(raw_args: str = None, ifunc: InputFunction = None, ofunc: OutputF
     Player.ofunc = ofunc
     players = []
     ai_only = True
-    pattern = re.compile(r"^\<\@[0-9]{18}\>$")
     for i, name in enumerate(args.prog):
         if name == "user":
             players.append(Human(i))                # Add extra arguments extracted from `args`
             ai_only = False
-        elif pattern.match(name):
+        elif _is_mention(name):
             players.append(Human(i, name, ifunc))   # Add extra arguments extracted from `args`
             ai_only = False
         else:
@@ -406,10 +734,10 @@ async def main(raw_args: str = None, ifunc: InputFunction = None, ofunc: OutputF
     origin_stdout = sys.stdout
     if args.silent:
         if not ai_only:
-            output = StringIO("Game cannot be silent since humans are playing")
-            tmp = output.getvalue()
-            await Player.print(output)
-            raise Exception(tmp)
+            message = "Game cannot be silent since humans are playing"
+            await Player.print(message)
+            await Player.flush()
+            raise Exception(message)
         if discord:
             Player.ofunc = None
         else:
@@ -428,5 +756,16 @@ async def main(raw_args: str = None, ifunc: InputFunction = None, ofunc: OutputF
     return players, winner, errors  # this should not be messed with because that's how the discord bot works
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # uvloop has faster subprocess pipes, it is used when installed (it isn't available on Windows)
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        # uvloop.run only exists since uvloop 0.18
+        if hasattr(uvloop, "run"):
+            uvloop.run(main())
+        else:
+            uvloop.install()
+            asyncio.run(main())
 